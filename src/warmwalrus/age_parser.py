@@ -1,32 +1,45 @@
-import re
+import functools
 import typing
 
+TIME_UNITS: typing.Dict[str, int] = {
+    "s": 1,  # seconds
+    "m": 60,  # minutes
+    "h": 3600,  # hours
+    "d": 86400,  # days
+    "w": 604800,  # weeks
+}
 
-class AgeParser:
-    """Parses age specifications like '10m', '1d', '2.3w'."""
 
-    TIME_UNITS: typing.Dict[str, int] = {
-        "s": 1,  # seconds
-        "m": 60,  # minutes
-        "h": 3600,  # hours
-        "d": 86400,  # days
-        "w": 604800,  # weeks
-    }
+@functools.lru_cache(maxsize=64)
+def parse_age(age_str: str) -> float:
+    """Parse age string and return seconds."""
+    # The unit must be the last character, so a trailing newline ("5m\n") is
+    # rejected rather than ignored
+    normalized: str = age_str.lower()
+    value: str = normalized[:-1]
+    unit: str = normalized[-1:]
 
-    def parse_age(self, age_str: str) -> float:
-        """Parse age string and return seconds."""
-        pattern: str = r"^(\d+(?:\.\d+)?)([smhdw])$"
-        match: typing.Optional[typing.Match[str]] = re.match(pattern, age_str.lower())
+    # Value must be digits with an optional fractional part, e.g. '2' or '2.3'
+    whole: str
+    separator: str
+    fraction: str
+    whole, separator, fraction = value.partition(".")
+    if not whole.isdecimal() or (separator and not fraction.isdecimal()):
+        raise ValueError(f"Invalid age format: {age_str}")
+
+    multiplier: typing.Optional[int] = TIME_UNITS.get(unit)
 
-        if not match:
-            raise ValueError(f"Invalid age format: {age_str}")
+    if multiplier is None:
+        raise ValueError(f"Invalid age format: {age_str}")
 
-        value: str
-        unit: str
-        value, unit = match.groups()
-        multiplier: typing.Optional[int] = self.TIME_UNITS.get(unit)
+    return float(value) * multiplier
 
-        if multiplier is None:
-            raise ValueError(f"Unknown time unit: {unit}")
 
-        return float(value) * multiplier
+class AgeParser:
+    """Parses age specifications like '10m', '1d', '2.3w'."""
+
+    TIME_UNITS: typing.Dict[str, int] = TIME_UNITS
+
+    def parse_age(self, age_str: str) -> float:
+        """Parse age string and return seconds."""
+        return parse_age(age_str)
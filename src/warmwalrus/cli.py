@@ -3,6 +3,7 @@ import importlib.metadata
 import logging
 import pathlib
 import sys
+import time
 import typing
 
 import warmwalrus.age_parser
@@ -35,7 +36,7 @@ class CLIHandler:
             "--exclude",
             action="append",
             default=[],
-            help="Exclude directories containing this substring (can be used multiple times)",
+            help="Exclude directories whose name contains this substring, or whose absolute path contains it if it includes a path separator (can be used multiple times)",
         )
 
         parser.add_argument(
@@ -106,10 +107,7 @@ class CLIHandler:
         # Parse age filter if provided
         age_filter: typing.Optional[float] = None
         if args.age:
-            age_parser: warmwalrus.age_parser.AgeParser = (
-                warmwalrus.age_parser.AgeParser()
-            )
-            age_filter = age_parser.parse_age(args.age)
+            age_filter = warmwalrus.age_parser.parse_age(args.age)
             logging.info(f"Age filter: {args.age} ({age_filter} seconds)")
 
         # Setup strategies
@@ -162,15 +160,6 @@ class CLIHandler:
             )
         )
 
-        logging.info(f"Searching for .{args.ext} files in: {args.paths}")
-        files_to_process: typing.List[pathlib.Path] = file_finder.find_files(args.paths)
-
-        if not files_to_process:
-            logging.info("No files found to process")
-            return
-
-        logging.info(f"Found {len(files_to_process)} files to process")
-
         # Process files
         processor: warmwalrus.file_processor.FileProcessor = (
             warmwalrus.file_processor.FileProcessor(
@@ -179,23 +168,43 @@ class CLIHandler:
         )
 
         processed_count: int = 0
-        for file_path in files_to_process:
-            try:
+        now: float = time.time()
+        debug_enabled: bool = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        logging.info(f"Searching for .{args.ext} files in: {args.paths}")
+
+        files_to_process: typing.List[pathlib.Path] = list(
+            file_finder.find_files(args.paths)
+        )
+
+        if not files_to_process:
+            logging.info("No files found to process")
+            return
+
+        logging.info(f"Found {len(files_to_process)} files to process")
+
+        try:
+            for file_path, changed in processor.process_files(
+                files_to_process, dry_run=args.dry_run, now=now
+            ):
                 if args.dry_run:
-                    if processor.needs_processing(file_path):
+                    if changed:
                         logging.info(f"Would process: {file_path}")
                         processed_count += 1
-                    else:
+                    elif debug_enabled:
                         logging.debug(f"Would skip (no markers): {file_path}")
                 else:
-                    if processor.process_file(file_path):
+                    if changed:
                         logging.info(f"Processed: {file_path}")
                         processed_count += 1
-                    else:
+                    elif debug_enabled:
                         logging.debug(f"Skipped (no changes): {file_path}")
-            except Exception as e:
-                logging.error(f"Error processing {file_path}: {e}")
-                sys.exit(1)
+        except warmwalrus.file_processor.FileProcessingError as e:
+            logging.error(f"Error processing {e.file_path}: {e.error}")
+            sys.exit(1)
+        except Exception as e:
+            logging.error(f"Error processing files: {e}")
+            sys.exit(1)
 
         if args.dry_run:
             logging.info(
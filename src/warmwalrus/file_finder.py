@@ -1,4 +1,5 @@
 import logging
+import os
 import pathlib
 import time
 import typing
@@ -16,73 +17,109 @@ class FileFinder:
         self.extension: str = extension
         self.excludes: typing.List[str] = excludes
         self.age_filter: typing.Optional[float] = age_filter
-
-    def find_files(self, paths: typing.List[str]) -> typing.List[pathlib.Path]:
-        """Find files matching the criteria."""
-        files: typing.List[pathlib.Path] = []
+        self._ext_dot: str = f".{extension}"
+        # Reference time for age checks, refreshed once per find_files batch
+        self._now: float = time.time()
+        # Plain excludes only need to be tested against each directory's own name,
+        # since every ancestor was already checked on the way down
+        self._name_excludes: typing.Tuple[str, ...] = tuple(
+            exclude for exclude in excludes if os.sep not in exclude
+        )
+        self._path_excludes: typing.Tuple[str, ...] = tuple(
+            exclude for exclude in excludes if os.sep in exclude
+        )
+
+    def find_files(self, paths: typing.List[str]) -> typing.Iterator[pathlib.Path]:
+        """Find files matching the criteria, yielding them as they are discovered."""
+        self._now = time.time()
 
         for path_str in paths:
             path: pathlib.Path = pathlib.Path(path_str)
 
             if path.is_file():
                 if self._should_process_file(path):
-                    files.append(path)
+                    yield path
             elif path.is_dir():
-                files.extend(self._find_files_in_directory(path))
+                yield from self._find_files_in_directory(path)
             else:
                 logging.warning(f"Path does not exist: {path}")
 
-        logging.info(f"Found {len(files)} files to process")
-        return files
-
     def _find_files_in_directory(
         self, directory: pathlib.Path
-    ) -> typing.List[pathlib.Path]:
-        """Recursively find files in directory."""
-        files: typing.List[pathlib.Path] = []
-
+    ) -> typing.Iterator[pathlib.Path]:
+        """Walk directory depth-first using an explicit stack instead of recursion."""
+        stack: typing.List[typing.Iterator[os.DirEntry[str]]] = []
+        self._push_directory(stack, directory)
+
+        while stack:
+            entry: typing.Optional[os.DirEntry[str]] = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            # Cheap name test first so non-matching files never hit stat
+            if entry.name.endswith(self._ext_dot) and entry.is_file():
+                if self._should_process_file(entry):
+                    yield pathlib.Path(entry.path)
+            elif entry.is_dir():
+                if not self._should_exclude_directory(entry):
+                    self._push_directory(stack, pathlib.Path(entry.path))
+
+    def _push_directory(
+        self,
+        stack: typing.List[typing.Iterator[os.DirEntry[str]]],
+        directory: pathlib.Path,
+    ) -> None:
+        """List directory and push its entries onto the walk stack."""
         try:
-            for item in directory.iterdir():
-                if item.is_file():
-                    if self._should_process_file(item):
-                        files.append(item)
-                elif item.is_dir():
-                    if not self._should_exclude_directory(item):
-                        files.extend(self._find_files_in_directory(item))
+            # Read the listing up front so the handle is closed before descending;
+            # DirEntry keeps the cached file type and stat results
+            with os.scandir(directory) as entries:
+                stack.append(iter(list(entries)))
         except PermissionError:
             logging.warning(f"Permission denied accessing: {directory}")
 
-        return files
-
-    def _should_process_file(self, file_path: pathlib.Path) -> bool:
+    def _should_process_file(
+        self, file_path: typing.Union[pathlib.Path, os.DirEntry[str]]
+    ) -> bool:
         """Check if file should be processed."""
         # Check extension
-        if not file_path.name.endswith(f".{self.extension}"):
+        if not file_path.name.endswith(self._ext_dot):
             return False
 
         # Check age filter
         if self.age_filter is not None:
             try:
                 file_mtime: float = file_path.stat().st_mtime
-                current_time: float = time.time()
-                age_seconds: float = current_time - file_mtime
+                age_seconds: float = self._now - file_mtime
 
                 # If file is OLDER than the age limit, skip it
                 if age_seconds > self.age_filter:
                     return False
             except OSError:
-                logging.warning(f"Could not check modification time for: {file_path}")
+                logging.warning(
+                    f"Could not check modification time for: {os.fspath(file_path)}"
+                )
                 return False
 
         return True
 
-    def _should_exclude_directory(self, directory: pathlib.Path) -> bool:
+    def _should_exclude_directory(self, directory: os.DirEntry[str]) -> bool:
         """Check if directory should be excluded."""
-        abs_path_str: str = str(directory.absolute())
+        name: str = directory.name
 
-        for exclude in self.excludes:
-            if exclude in abs_path_str:
-                logging.debug(f"Excluding directory: {directory}")
+        for exclude in self._name_excludes:
+            if exclude in name:
+                logging.debug("Excluding directory: %s", directory.path)
                 return True
 
+        if self._path_excludes:
+            # Walked paths are relative when the user passed a relative root
+            abs_path_str: str = str(pathlib.Path(directory.path).absolute())
+
+            for exclude in self._path_excludes:
+                if exclude in abs_path_str:
+                    logging.debug("Excluding directory: %s", directory.path)
+                    return True
+
         return False
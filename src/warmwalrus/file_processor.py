@@ -1,16 +1,46 @@
+import concurrent.futures
+import errno
 import logging
+import os
 import pathlib
+import queue
+import tempfile
+import threading
 import time
 import typing
 
 import warmwalrus.strategies.base
 
 
+class FileProcessingError(Exception):
+    """Raised by FileProcessor.process_files when one of the files fails."""
+
+    def __init__(self, file_path: pathlib.Path, error: Exception) -> None:
+        super().__init__(f"{file_path}: {error}")
+        self.file_path: pathlib.Path = file_path
+        self.error: Exception = error
+
+
 class FileProcessor:
     """Processes files by removing content between markers and applying strategies."""
 
     START_MARKERS: typing.List[str] = [".......... START ..........", "<response>"]
     END_MARKERS: typing.List[str] = [".......... END ..........", "</response>"]
+    _MARKERS_BYTES: typing.Tuple[bytes, ...] = tuple(
+        marker.encode("utf-8") for marker in START_MARKERS + END_MARKERS
+    )
+    # Characters other than "\n" that str.splitlines() treats as line boundaries
+    _LINE_BREAKS: typing.Tuple[str, ...] = (
+        "\r",
+        "\v",
+        "\f",
+        "\x1c",
+        "\x1d",
+        "\x1e",
+        "\x85",
+        "\u2028",
+        "\u2029",
+    )
 
     def __init__(
         self,
@@ -26,68 +56,137 @@ class FileProcessor:
             strategies: List of processing strategies to apply after marker cleanup
             age_filter: Age filter in seconds (same as used by FileFinder)
         """
-        self.strategies = strategies or []
-        self.age_filter = age_filter
+        self._strategies: typing.Tuple[
+            warmwalrus.strategies.base.FileProcessingStrategy, ...
+        ] = tuple(strategies or [])
+        self._age_filter: typing.Optional[float] = age_filter
+
+        # Specialize the per-file checks once for this configuration instead of
+        # re-testing it for every file. Both settings are read-only properties, so
+        # these choices cannot go stale.
+        self._age_check: typing.Callable[
+            [pathlib.Path, typing.Optional[float]], bool
+        ] = (
+            self._skip_age_criteria
+            if self._age_filter is None
+            else self._meets_age_criteria
+        )
+        self._needs_processing_check: typing.Callable[
+            [pathlib.Path, typing.Optional[float]], bool
+        ] = (
+            self._needs_processing_with_strategies
+            if self._strategies
+            else self._needs_processing_markers_only
+        )
+
+    @property
+    def strategies(
+        self,
+    ) -> typing.Tuple[warmwalrus.strategies.base.FileProcessingStrategy, ...]:
+        """Processing strategies applied after marker cleanup."""
+        return self._strategies
+
+    @property
+    def age_filter(self) -> typing.Optional[float]:
+        """Age filter in seconds, or None to process files of any age."""
+        return self._age_filter
 
-    def needs_processing(self, file_path: pathlib.Path) -> bool:
-        """Check if file needs processing (has markers or strategies would modify it)."""
+    def needs_processing(
+        self, file_path: pathlib.Path, now: typing.Optional[float] = None
+    ) -> bool:
+        """
+        Check if file needs processing (has markers or strategies would modify it).
+
+        Args:
+            file_path: Path to the file to check
+            now: Reference time for the age check; pass one snapshot for a whole batch
+        """
+        return self._needs_processing_check(file_path, now)
+
+    def _needs_processing_with_strategies(
+        self, file_path: pathlib.Path, now: typing.Optional[float] = None
+    ) -> bool:
+        """needs_processing for a processor with strategies configured."""
         try:
             # First check if file meets age criteria (same logic as FileFinder)
-            if not self._meets_age_criteria(file_path):
+            if not self._age_check(file_path, now):
                 return False
 
-            content: str = file_path.read_text(encoding="utf-8")
+            data: bytes = self._read_once(file_path)
+
+            has_marker_bytes: bool = any(
+                marker in data for marker in self._MARKERS_BYTES
+            )
+            content: str = self._decode(data)
 
             # Check if file has markers
-            if self._has_markers(content):
+            if has_marker_bytes and self._has_markers(content):
                 return True
 
-            # Check if any strategy would modify the content or rename the file
-            if self.strategies:
-                for strategy in self.strategies:
-                    if strategy.is_renaming_strategy():
-                        # For renaming strategies, check if rename would happen
-                        new_path = strategy.rename_file(file_path)
-                        if new_path and new_path != file_path:
-                            return True
-                    else:
-                        # For content strategies, check if content would change
-                        processed_content = strategy.process(content, file_path)
-                        if processed_content != content:
-                            return True
+            # Check if any strategy would modify the content or rename the file,
+            # without performing the rename itself
+            for strategy in self.strategies:
+                if strategy.is_renaming_strategy():
+                    if strategy.would_rename_file(file_path, content):
+                        return True
+                else:
+                    # For content strategies, check if content would change
+                    processed_content = strategy.process(content, file_path, content)
+                    if processed_content != content:
+                        return True
 
             return False
         except Exception as e:
             logging.error(f"Error reading {file_path}: {e}")
             return False
 
+    def _needs_processing_markers_only(
+        self, file_path: pathlib.Path, now: typing.Optional[float] = None
+    ) -> bool:
+        """needs_processing for a processor without strategies: markers decide alone."""
+        try:
+            if not self._age_check(file_path, now):
+                return False
+
+            data: bytes = self._read_once(file_path)
+
+            if not any(marker in data for marker in self._MARKERS_BYTES):
+                return False
+
+            return self._has_markers(self._decode(data))
+        except Exception as e:
+            logging.error(f"Error reading {file_path}: {e}")
+            return False
+
     def process_file(self, file_path: pathlib.Path) -> bool:
         """Process a single file, returning True if changes were made."""
         try:
-            original_content: str = file_path.read_text(encoding="utf-8")
+            original_content: str = self._decode(self._read_once(file_path))
             changes_made = False
 
             # First, apply renaming strategies
             current_path = file_path
             for strategy in self.strategies:
                 if strategy.is_renaming_strategy():
-                    new_path = strategy.rename_file(current_path)
+                    new_path = strategy.rename_file(current_path, original_content)
                     if new_path and new_path != current_path:
                         current_path = new_path
                         changes_made = True
 
             # Then, process markers
-            processed_content: str = self._process_content(original_content)
+            markers_removed: bool
+            processed_content: str
+            markers_removed, processed_content = self._process_content(original_content)
 
             # Then apply content strategies
             for strategy in self.strategies:
                 if not strategy.is_renaming_strategy():
                     processed_content = strategy.process(
-                        processed_content, current_path
+                        processed_content, current_path, original_content
                     )
 
-            if processed_content != original_content:
-                current_path.write_text(processed_content, encoding="utf-8")
+            if markers_removed or processed_content != original_content:
+                self._write_atomic(current_path, processed_content)
                 changes_made = True
 
             return changes_made
@@ -95,64 +194,367 @@ class FileProcessor:
             logging.error(f"Error processing {file_path}: {e}")
             raise
 
+    def process_files(
+        self,
+        file_paths: typing.Iterable[pathlib.Path],
+        dry_run: bool = False,
+        now: typing.Optional[float] = None,
+        max_workers: typing.Optional[int] = None,
+    ) -> typing.Iterator[typing.Tuple[pathlib.Path, bool]]:
+        """
+        Process (or with dry_run, check) many files concurrently.
+
+        File processing is dominated by I/O, which releases the GIL, so a thread
+        pool overlaps the work on different directories. Renames only move a file
+        within its own directory, so each directory's files are handled by one
+        task, in the given order; two files can then never be renamed onto or
+        rewritten at the same path at once. After the first error no further
+        files are started; it is re-raised once the running ones are reported.
+
+        Args:
+            file_paths: Paths of the files to process
+            dry_run: Only check whether each file needs processing
+            now: Reference time for dry-run age checks
+            max_workers: Thread count (default: four per CPU, capped at 32)
+
+        Returns:
+            Iterator of (file path, whether it needs or received changes), in
+            the order the files complete
+
+        Raises:
+            FileProcessingError: A file failed; carries its path and the error
+        """
+        workers: int = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        stop: threading.Event = threading.Event()
+        # Workers report every file as soon as it is done, and None once their
+        # directory is finished or abandoned
+        results: queue.SimpleQueue[
+            typing.Optional[typing.Tuple[pathlib.Path, typing.Union[bool, Exception]]]
+        ] = queue.SimpleQueue()
+        failure: typing.Optional[typing.Tuple[pathlib.Path, Exception]] = None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            groups: typing.List[typing.List[pathlib.Path]] = self._group_by_directory(
+                file_paths
+            )
+            for directory_files in groups:
+                executor.submit(
+                    self._process_directory_files,
+                    directory_files,
+                    dry_run,
+                    now,
+                    stop,
+                    results,
+                )
+
+            try:
+                remaining: int = len(groups)
+                while remaining:
+                    item = results.get()
+                    if item is None:
+                        remaining -= 1
+                        continue
+
+                    file_path, outcome = item
+                    if isinstance(outcome, Exception):
+                        # Start no further files, but still report the ones that
+                        # running tasks complete before raising
+                        failure = failure or (file_path, outcome)
+                        stop.set()
+                        continue
+
+                    yield file_path, outcome
+            finally:
+                # After an abandoned iteration, running tasks stop after their
+                # current file and queued ones never start
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if failure is not None:
+            raise FileProcessingError(*failure) from failure[1]
+
+    def _process_directory_files(
+        self,
+        file_paths: typing.List[pathlib.Path],
+        dry_run: bool,
+        now: typing.Optional[float],
+        stop: threading.Event,
+        results: queue.SimpleQueue[
+            typing.Optional[typing.Tuple[pathlib.Path, typing.Union[bool, Exception]]]
+        ],
+    ) -> None:
+        """Check or process one directory's files in order, reporting each to results."""
+        try:
+            for file_path in file_paths:
+                if stop.is_set():
+                    break
+
+                try:
+                    changed: bool = (
+                        self.needs_processing(file_path, now)
+                        if dry_run
+                        else self.process_file(file_path)
+                    )
+                except Exception as e:
+                    results.put((file_path, e))
+                    break
+
+                results.put((file_path, changed))
+        finally:
+            results.put(None)
+
+    @staticmethod
+    def _group_by_directory(
+        file_paths: typing.Iterable[pathlib.Path],
+    ) -> typing.List[typing.List[pathlib.Path]]:
+        """Group files by their (resolved) parent directory, keeping their order."""
+        groups: typing.Dict[str, typing.List[pathlib.Path]] = {}
+        resolved: typing.Dict[pathlib.Path, str] = {}
+
+        for file_path in file_paths:
+            parent: pathlib.Path = file_path.parent
+            # Resolve so the same directory reached via a symlink or a different
+            # relative spelling lands in the same group
+            key: typing.Optional[str] = resolved.get(parent)
+            if key is None:
+                key = resolved[parent] = os.path.realpath(parent)
+            groups.setdefault(key, []).append(file_path)
+
+        return list(groups.values())
+
     def _apply_strategies(self, content: str, file_path: pathlib.Path) -> str:
         """Apply all configured strategies to the content."""
         result = content
         for strategy in self.strategies:
-            logging.debug(f"Applying strategy {strategy.get_name()} to {file_path}")
-            result = strategy.process(result, file_path)
+            logging.debug("Applying strategy %s to %s", strategy.get_name(), file_path)
+            result = strategy.process(result, file_path, content)
         return result
 
     def _has_markers(self, content: str) -> bool:
         """Check if content has start or end markers at line beginnings."""
-        lines: typing.List[str] = content.splitlines()
-
-        for line in lines:
-            stripped_line: str = line.strip()
-            if stripped_line in self.START_MARKERS or stripped_line in self.END_MARKERS:
-                return True
+        for _ in self._iter_marker_lines(content):
+            return True
 
         return False
 
-    def _process_content(self, content: str) -> str:
-        """Process content by keeping only what's between markers."""
-        lines: typing.List[str] = content.splitlines(keepends=True)
-        result_lines: typing.List[str] = []
-        keep_mode: bool = False
-        found_start: bool = False
+    def _process_content(self, content: str) -> typing.Tuple[bool, str]:
+        """
+        Process content by keeping only what's between markers.
 
-        for line in lines:
-            stripped_line: str = line.strip()
+        Returns:
+            Tuple of (whether any markers were removed, resulting content)
+        """
+        # Without START marker text the result is the original content, so skip
+        # locating END markers and validating lines entirely
+        if not any(marker in content for marker in self.START_MARKERS):
+            return False, content
 
-            if stripped_line in self.START_MARKERS:
-                keep_mode = True
-                found_start = True
-                continue
-            elif stripped_line in self.END_MARKERS:
-                keep_mode = False
-                continue
+        marker_lines: typing.List[typing.Tuple[int, int, bool]] = sorted(
+            self._iter_marker_lines(content)
+        )
+        parts: typing.List[str] = []
+        position: int = 0
+        keep_mode: bool = False
+        found_start: bool = False
 
+        for line_start, line_end, is_start in marker_lines:
             if keep_mode:
-                result_lines.append(line)
+                parts.append(content[position:line_start])
+
+            keep_mode = is_start
+            found_start = found_start or is_start
+            position = line_end
 
         # If no START marker was found, return original content
         if not found_start:
-            return content
+            return False, content
 
-        return "".join(result_lines)
+        if keep_mode:
+            parts.append(content[position:])
 
-    def _meets_age_criteria(self, file_path: pathlib.Path) -> bool:
-        """Check if file meets age criteria (same logic as FileFinder)."""
-        if self.age_filter is None:
-            return True
+        return True, "".join(parts)
+
+    def _iter_marker_lines(
+        self, content: str
+    ) -> typing.Iterator[typing.Tuple[int, int, bool]]:
+        """
+        Locate lines holding only a marker (surrounding whitespace allowed).
+
+        Each marker is found with a C-level substring search rather than by
+        splitting the content into lines. Results are grouped per marker, not
+        in document order.
+
+        Returns:
+            Iterator of (line start, line end including its line break, is start marker)
+        """
+        for markers, is_start in (
+            (self.START_MARKERS, True),
+            (self.END_MARKERS, False),
+        ):
+            for marker in markers:
+                index: int = content.find(marker)
+
+                while index != -1:
+                    span: typing.Optional[typing.Tuple[int, int]] = (
+                        self._marker_line_span(content, index, marker)
+                    )
+                    if span is None:
+                        index = content.find(marker, index + len(marker))
+                        continue
+
+                    yield span[0], span[1], is_start
+                    index = content.find(marker, span[1])
+
+    def _marker_line_span(
+        self, content: str, index: int, marker: str
+    ) -> typing.Optional[typing.Tuple[int, int]]:
+        """Return the span of the line containing index if it holds only marker."""
+        region_start: int = content.rfind("\n", 0, index) + 1
+        region_end: int = content.find("\n", index)
+        if region_end == -1:
+            region_end = len(content)
+
+        # Common case: the marker fills its line exactly, so no slicing is needed
+        if region_start == index and region_end == index + len(marker):
+            if region_end < len(content):
+                region_end += 1
+            return region_start, region_end
+
+        # Lines almost always end at "\n", but splitlines() also honours rarer breaks
+        line_start: int = region_start
+        for line in content[region_start:region_end].splitlines(keepends=True):
+            line_end: int = line_start + len(line)
+
+            if line_end > index:
+                if line.strip() != marker:
+                    return None
+
+                # Take the "\n" that bounded the region as this line's ending,
+                # unless the line already ended in another break ("\r\n" is one break)
+                if line_end < len(content) and line_end == region_end:
+                    if not line.endswith(self._LINE_BREAKS) or line.endswith("\r"):
+                        line_end += 1
+
+                return line_start, line_end
+
+            line_start = line_end
+
+        return None
+
+    @staticmethod
+    def _read_once(file_path: pathlib.Path) -> bytes:
+        """Read the whole file with a single unbuffered, pre-sized read."""
+        # Unbuffered FileIO sizes its buffer from fstat, so this is one read() call
+        # instead of read_text's buffered chunks and text-layer wrapping
+        with open(file_path, "rb", buffering=0) as f:
+            return f.read()
+
+    @staticmethod
+    def _write_atomic(file_path: pathlib.Path, content: str) -> None:
+        """
+        Write content with a single unbuffered write to a temp file, then replace.
+
+        Hard-linked files, and files whose owner cannot be kept, are rewritten in
+        place instead so that their links and ownership survive.
+        """
+        # Write through symlinks rather than replacing the link itself
+        if file_path.is_symlink():
+            file_path = pathlib.Path(os.path.realpath(file_path))
+
+        # Replacing only needs write access to the directory; keep refusing files
+        # the user cannot write, as writing in place does
+        if not os.access(file_path, os.W_OK):
+            raise PermissionError(
+                errno.EACCES, os.strerror(errno.EACCES), os.fspath(file_path)
+            )
+
+        data: bytes = content.encode("utf-8")
+        stat_result: os.stat_result = file_path.stat()
+
+        # Replacing would detach this name from the file's other hard links
+        if stat_result.st_nlink > 1:
+            FileProcessor._write_in_place(file_path, data)
+            return
+
+        # A unique, exclusively created name next to the target, so concurrent
+        # writers and existing user files are never clobbered
+        fd: int
+        tmp_name: str
+        fd, tmp_name = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+        )
+        try:
+            try:
+                FileProcessor._write_all(fd, data)
+
+                # Make the data durable before the rename makes it visible
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # Keep the original owner and group. Only root can give a file away, so
+            # when that fails rewrite the original in place rather than silently
+            # taking ownership of it
+            if hasattr(os, "chown"):
+                try:
+                    os.chown(tmp_name, stat_result.st_uid, stat_result.st_gid)
+                except OSError:
+                    pathlib.Path(tmp_name).unlink(missing_ok=True)
+                    FileProcessor._write_in_place(file_path, data)
+                    return
+
+            # mkstemp creates the file 0600; keep the original bits exactly
+            os.chmod(tmp_name, stat_result.st_mode & 0o7777)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            pathlib.Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _write_in_place(file_path: pathlib.Path, data: bytes) -> None:
+        """Truncate and rewrite the existing file, keeping its inode and metadata."""
+        fd: int = os.open(file_path, os.O_WRONLY | os.O_TRUNC)
+        try:
+            FileProcessor._write_all(fd, data)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        """Write all of data to fd, continuing after short writes."""
+        view: memoryview = memoryview(data)
+        written: int = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """Decode raw file bytes the same way read_text does (universal newlines)."""
+        return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    def _skip_age_criteria(
+        self, file_path: pathlib.Path, now: typing.Optional[float] = None
+    ) -> bool:
+        """Age check used when no age filter is configured."""
+        return True
+
+    def _meets_age_criteria(
+        self, file_path: pathlib.Path, now: typing.Optional[float] = None
+    ) -> bool:
+        """
+        Check if file meets age criteria (same logic as FileFinder).
+
+        Only used when an age filter is configured; see _skip_age_criteria.
+        """
+        age_filter: float = typing.cast(float, self._age_filter)
 
         try:
             file_mtime: float = file_path.stat().st_mtime
-            current_time: float = time.time()
+            current_time: float = time.time() if now is None else now
             age_seconds: float = current_time - file_mtime
 
             # If file is OLDER than the age limit, skip it
-            return age_seconds <= self.age_filter
+            return age_seconds <= age_filter
         except OSError:
             logging.warning(f"Could not check modification time for: {file_path}")
             return False
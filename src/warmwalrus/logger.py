@@ -7,13 +7,8 @@ class LoggerSetup:
 
     def setup_main_logging(self, verbose_count: int) -> None:
         """Configure main app logging based on verbosity level."""
-        log_levels = {
-            0: logging.WARNING,  # Only warnings and errors
-            1: logging.INFO,  # Command execution info
-            2: logging.DEBUG,  # Detailed debugging
-        }
-
-        level = log_levels.get(verbose_count, logging.DEBUG)
+        # Each -v lowers the level one step: WARNING, INFO, then DEBUG
+        level = max(logging.DEBUG, logging.WARNING - verbose_count * 10)
 
         # Configure main logger
         main_logger = logging.getLogger()
@@ -27,14 +22,8 @@ class LoggerSetup:
         """Configure subcommand logging based on verbosity level."""
         # Subcommand verbosity controls different output than main app verbosity
         # This is for internal subcommand logging only
-        sub_log_levels = {
-            0: logging.ERROR,  # Only errors
-            1: logging.WARNING,  # Warnings and errors
-            2: logging.INFO,  # Info, warnings, errors
-            3: logging.DEBUG,  # Everything
-        }
-
-        level = sub_log_levels.get(verbose_count, logging.DEBUG)
+        # Each -v lowers the level one step: ERROR, WARNING, INFO, then DEBUG
+        level = max(logging.DEBUG, logging.ERROR - verbose_count * 10)
 
         # Create subcommand logger
         sub_logger = logging.getLogger("subcommand")
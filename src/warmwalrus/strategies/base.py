@@ -7,13 +7,19 @@ class FileProcessingStrategy(abc.ABC):
     """Abstract base class for file processing strategies."""
 
     @abc.abstractmethod
-    def process(self, content: str, file_path: pathlib.Path) -> str:
+    def process(
+        self,
+        content: str,
+        file_path: pathlib.Path,
+        full_content: typing.Optional[str] = None,
+    ) -> str:
         """
         Process file content and return modified content.
 
         Args:
             content: The file content to process
             file_path: Path to the file being processed
+            full_content: The original file content, if the caller already read it
 
         Returns:
             The processed content
@@ -29,17 +35,34 @@ class FileProcessingStrategy(abc.ABC):
         """Return True if this strategy renames files."""
         return False
 
-    def rename_file(self, file_path: pathlib.Path) -> typing.Optional[pathlib.Path]:
+    def rename_file(
+        self, file_path: pathlib.Path, full_content: typing.Optional[str] = None
+    ) -> typing.Optional[pathlib.Path]:
         """
         Rename the file if this is a renaming strategy.
 
         Args:
             file_path: Path to the file to potentially rename
+            full_content: The file content, if the caller already read it
         Returns:
             New path if renamed, None if not renamed or not a renaming strategy
         """
         return None
 
+    def would_rename_file(
+        self, file_path: pathlib.Path, full_content: typing.Optional[str] = None
+    ) -> bool:
+        """
+        Check whether rename_file would rename the file, without renaming it.
+
+        Args:
+            file_path: Path to the file to check
+            full_content: The file content, if the caller already read it
+        Returns:
+            True if the file would be renamed
+        """
+        return False
+
     def set_allow_overwrite(self, allow_overwrite: bool) -> None:
         """Set whether to allow overwriting existing files. Default implementation does nothing."""
         pass
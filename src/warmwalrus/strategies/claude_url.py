@@ -1,6 +1,7 @@
 import logging
 import pathlib
 import re
+import typing
 
 import warmwalrus.strategies.base
 
@@ -17,27 +18,36 @@ class ClaudeUrlStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
         )
         self.logger = logging.getLogger(__name__)
 
-    def process(self, content: str, file_path: pathlib.Path) -> str:
+    def process(
+        self,
+        content: str,
+        file_path: pathlib.Path,
+        full_content: typing.Optional[str] = None,
+    ) -> str:
         """
         Extract Claude URL from the full document and prepend it to the processed content.
 
         Note: This strategy should be applied AFTER marker processing, so the content
         passed here is already the extracted content between START/END markers.
-        To access the full document, we need to read the original file.
+        To access the full document, we use full_content or read the original file.
 
         Args:
             content: The already processed content (between markers)
             file_path: Path to the file being processed
+            full_content: The original file content, if the caller already read it
 
         Returns:
             Content with Claude URL prepended if found
         """
-        self.logger.debug(f"Processing file {file_path} with claude_url strategy")
+        self.logger.debug("Processing file %s with claude_url strategy", file_path)
 
         try:
-            # Read the full original file to search for the Claude URL
-            full_content = file_path.read_text(encoding="utf-8")
-            self.logger.debug(f"Read {len(full_content)} characters from {file_path}")
+            if full_content is None:
+                # Read the full original file to search for the Claude URL
+                full_content = file_path.read_text(encoding="utf-8")
+                self.logger.debug(
+                    "Read %d characters from %s", len(full_content), file_path
+                )
 
             # Search for Claude discussion URL in the full document
             match = self.claude_url_pattern.search(full_content)
@@ -49,7 +59,8 @@ class ClaudeUrlStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
                 # Prepend the URL to the processed content with proper spacing
                 if content.strip():
                     self.logger.debug(
-                        f"Prepending Claude URL to existing content ({len(content)} chars)"
+                        "Prepending Claude URL to existing content (%d chars)",
+                        len(content),
                     )
                     # Add the URL with spacing before the existing content
                     return f"\n\n\n\n\n{claude_url}\n\n\n\n\n{content}"
@@ -60,7 +71,7 @@ class ClaudeUrlStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
                     # If no content, just return the URL
                     return claude_url
             else:
-                self.logger.debug(f"No Claude URL found in {file_path}")
+                self.logger.debug("No Claude URL found in %s", file_path)
 
             # No Claude URL found, return content unchanged
             return content
@@ -1,3 +1,4 @@
+import functools
 import logging
 import pathlib
 import re
@@ -8,6 +9,41 @@ import pathvalidate
 import warmwalrus.strategies.base
 
 
+@functools.lru_cache(maxsize=4096)
+def sanitize_title(title: str, max_length: int) -> str:
+    """
+    Sanitize a title for use as a filename, truncated to max_length characters.
+
+    Results are cached since pathvalidate's sanitization is comparatively
+    expensive; this only pays off when the same title appears in several files.
+
+    Args:
+        title: The raw title string
+        max_length: Maximum length of the sanitized name
+
+    Returns:
+        Sanitized filename string, empty if nothing usable remains
+    """
+    if not title or not title.strip():
+        return ""
+
+    # Use pathvalidate to handle cross-platform filename sanitization
+    # replacement_text=" " preserves spaces instead of using underscores
+    sanitized = pathvalidate.sanitize_filename(title, replacement_text=" ")
+
+    if len(sanitized) > max_length:
+        sanitized = sanitized[:max_length].rstrip()
+
+    # Final cleanup
+    sanitized = sanitized.strip()
+
+    # Final check - ensure we still have something left
+    if not sanitized:
+        return ""
+
+    return sanitized
+
+
 class FileRenamerStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
     """Strategy to rename files based on CLAUDE_THREAD_TITLE found in the content."""
 
@@ -26,9 +62,10 @@ class FileRenamerStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
             r"^CLAUDE_THREAD_TITLE:\s*.+?$",
             re.IGNORECASE | re.MULTILINE,
         )
+        # Pattern to match runs of blank lines left behind after removing title lines
+        self.blank_lines_pattern = re.compile(r"\n{3,}")
         self.logger = logging.getLogger(__name__)
         self.allow_overwrite = True  # Default to allowing overwrite
-        self.title_used_for_rename = None  # Track which title was used for renaming
 
     def set_allow_overwrite(self, allow_overwrite: bool) -> None:
         """Set whether to allow overwriting existing files."""
@@ -38,52 +75,120 @@ class FileRenamerStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
         """Return True since this strategy renames files."""
         return True
 
-    def rename_file(self, file_path: pathlib.Path) -> typing.Optional[pathlib.Path]:
+    def rename_file(
+        self, file_path: pathlib.Path, full_content: typing.Optional[str] = None
+    ) -> typing.Optional[pathlib.Path]:
         """
         Rename the file based on CLAUDE_THREAD_TITLE found in the content.
 
         Args:
             file_path: Path to the file to rename
+            full_content: The file content, if the caller already read it
 
         Returns:
             New path if renamed, None if not renamed
         """
-        self.logger.debug(f"Processing file {file_path} with file_renamer strategy")
+        new_path = self._get_target_path(file_path, full_content)
+        if new_path is None:
+            return None
 
-        try:
-            full_content = file_path.read_text(encoding="utf-8")
-            self.logger.debug(f"Read {len(full_content)} characters from {file_path}")
-        except UnicodeDecodeError as e:
-            self.logger.error(f"Cannot read {file_path} as UTF-8: {e}")
+        # Check if rename is needed
+        if new_path == file_path:
+            self.logger.debug("File %s already has the correct name", file_path)
+            return file_path
+
+        # Check if target already exists; when overwriting is allowed, replace()
+        # swaps it out atomically without a separate exists/unlink step
+        if not self.allow_overwrite and new_path.exists():
+            self.logger.warning(
+                f"Cannot rename {file_path} to {new_path}: target file already exists"
+            )
             return None
-        except Exception as e:
-            self.logger.error(f"Error reading {file_path}: {e}")
+
+        # Perform the rename
+        try:
+            file_path.replace(new_path)
+            self.logger.info(f"Successfully renamed {file_path} to {new_path}")
+            return new_path
+        except OSError as e:
+            self.logger.error(f"Failed to rename {file_path} to {new_path}: {e}")
             return None
 
+    def would_rename_file(
+        self, file_path: pathlib.Path, full_content: typing.Optional[str] = None
+    ) -> bool:
+        """
+        Check whether rename_file would rename the file, without touching it.
+
+        Args:
+            file_path: Path to the file to check
+            full_content: The file content, if the caller already read it
+
+        Returns:
+            True if the file would be renamed
+        """
+        new_path = self._get_target_path(file_path, full_content)
+        if new_path is None or new_path == file_path:
+            return False
+
+        return self.allow_overwrite or not new_path.exists()
+
+    def _get_target_path(
+        self, file_path: pathlib.Path, full_content: typing.Optional[str] = None
+    ) -> typing.Optional[pathlib.Path]:
+        """
+        Work out the path the file should have based on its CLAUDE_THREAD_TITLE.
+
+        Args:
+            file_path: Path to the file
+            full_content: The file content, if the caller already read it
+
+        Returns:
+            Target path, or None if the content has no usable title
+        """
+        self.logger.debug("Processing file %s with file_renamer strategy", file_path)
+
+        if full_content is None:
+            try:
+                full_content = file_path.read_text(encoding="utf-8")
+                self.logger.debug(
+                    "Read %d characters from %s", len(full_content), file_path
+                )
+            except UnicodeDecodeError as e:
+                self.logger.error(f"Cannot read {file_path} as UTF-8: {e}")
+                return None
+            except Exception as e:
+                self.logger.error(f"Error reading {file_path}: {e}")
+                return None
+
         # Find all CLAUDE_THREAD_TITLE matches in the document
-        matches = list(self.thread_title_pattern.finditer(full_content))
-        if not matches:
-            self.logger.debug(f"No CLAUDE_THREAD_TITLE found in {file_path}")
+        titles: typing.List[str] = [
+            match.group(1) for match in self.thread_title_pattern.finditer(full_content)
+        ]
+
+        if not titles:
+            self.logger.debug("No CLAUDE_THREAD_TITLE found in %s", file_path)
             return None
 
         # Look for the first non-placeholder title
         actual_title = None
-        for match in matches:
-            title = match.group(1).strip()
+        for raw_title in titles:
+            title = raw_title.strip()
             if title != self.TITLE_PLACEHOLDER:
                 actual_title = title
-                self.title_used_for_rename = title  # Store the title used for renaming
                 self.logger.info(
                     f"Found actual CLAUDE_THREAD_TITLE in {file_path}: {title}"
                 )
                 break
             else:
                 self.logger.debug(
-                    f"Skipping placeholder title '{self.TITLE_PLACEHOLDER}' in {file_path}"
+                    "Skipping placeholder title '%s' in %s",
+                    self.TITLE_PLACEHOLDER,
+                    file_path,
                 )
 
         if not actual_title:
-            self.logger.debug(f"Only placeholder titles found in {file_path}")
+            self.logger.debug("Only placeholder titles found in %s", file_path)
             return None
 
         # Clean the title for use as filename
@@ -95,49 +200,21 @@ class FileRenamerStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
             return None
 
         # Create new filename with .md extension
-        new_filename = f"{clean_title}.md"
-        new_path = file_path.parent / new_filename
-
-        # Check if rename is needed
-        if new_path == file_path:
-            self.logger.debug(f"File {file_path} already has the correct name")
-            return file_path
-
-        # Check if target already exists
-        if new_path.exists():
-            if not self.allow_overwrite:
-                self.logger.warning(
-                    f"Cannot rename {file_path} to {new_path}: target file already exists"
-                )
-                return None
-            else:
-                self.logger.info(
-                    f"Target file {new_path} exists but will be overwritten"
-                )
-                # Remove the existing target file
-                try:
-                    new_path.unlink()
-                    self.logger.debug(f"Removed existing file {new_path}")
-                except OSError as e:
-                    self.logger.error(f"Failed to remove existing file {new_path}: {e}")
-                    return None
-
-        # Perform the rename
-        try:
-            file_path.rename(new_path)
-            self.logger.info(f"Successfully renamed {file_path} to {new_path}")
-            return new_path
-        except OSError as e:
-            self.logger.error(f"Failed to rename {file_path} to {new_path}: {e}")
-            return None
-
-    def process(self, content: str, file_path: pathlib.Path) -> str:
+        return file_path.with_name(clean_title + ".md")
+
+    def process(
+        self,
+        content: str,
+        file_path: pathlib.Path,
+        full_content: typing.Optional[str] = None,
+    ) -> str:
         """
         Remove CLAUDE_THREAD_TITLE lines from content after renaming is complete.
 
         Args:
             content: The file content to process
             file_path: Path to the file being processed
+            full_content: Unused; only the processed content is cleaned
 
         Returns:
             Content with CLAUDE_THREAD_TITLE lines removed
@@ -150,7 +227,7 @@ class FileRenamerStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
 
         # Clean up any extra blank lines that might have been left behind
         # Replace multiple consecutive newlines with at most two newlines
-        processed_content = re.sub(r"\n{3,}", "\n\n", processed_content)
+        processed_content = self.blank_lines_pattern.sub("\n\n", processed_content)
 
         if processed_content != content:
             self.logger.info(
@@ -169,27 +246,9 @@ class FileRenamerStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
         Returns:
             Sanitized filename string
         """
-        if not title or not title.strip():
-            return ""
-
-        # Use pathvalidate to handle cross-platform filename sanitization
-        # replacement_text=" " preserves spaces instead of using underscores
-        sanitized = pathvalidate.sanitize_filename(title, replacement_text=" ")
-
         # Limit length to reasonable filename length (most filesystems support 255 chars)
         # Leave room for .md extension (3 chars)
-        max_length = 200
-        if len(sanitized) > max_length:
-            sanitized = sanitized[:max_length].rstrip()
-
-        # Final cleanup
-        sanitized = sanitized.strip()
-
-        # Final check - ensure we still have something left
-        if not sanitized:
-            return ""
-
-        return sanitized
+        return sanitize_title(title, 200)
 
     def get_name(self) -> str:
         """Get the name of this strategy."""
@@ -1,4 +1,5 @@
 import pathlib
+import typing
 
 import warmwalrus.strategies.base
 
@@ -15,13 +16,19 @@ class NewlinePaddingStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
         """
         self.newline_count = newline_count
 
-    def process(self, content: str, file_path: pathlib.Path) -> str:
+    def process(
+        self,
+        content: str,
+        file_path: pathlib.Path,
+        full_content: typing.Optional[str] = None,
+    ) -> str:
         """
         Process content to ensure it starts with the specified number of newlines.
 
         Args:
             content: The file content to process
             file_path: Path to the file being processed
+            full_content: Unused; padding only depends on the processed content
 
         Returns:
             Content with proper newline padding at the beginning
@@ -30,12 +37,7 @@ class NewlinePaddingStrategy(warmwalrus.strategies.base.FileProcessingStrategy):
             return "\n" * self.newline_count
 
         # Count existing leading newlines
-        leading_newlines = 0
-        for char in content:
-            if char == "\n":
-                leading_newlines += 1
-            else:
-                break
+        leading_newlines = len(content) - len(content.lstrip("\n"))
 
         if leading_newlines >= self.newline_count:
             return content
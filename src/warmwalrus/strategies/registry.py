@@ -9,6 +9,9 @@ import warmwalrus.strategies.newline_padding
 class StrategyRegistry:
     """Registry for managing file processing strategies."""
 
+    # Strategies applied when none are specified, in application order
+    DEFAULT_STRATEGY_NAMES: typing.Tuple[str, ...] = ("file_renamer", "claude_url")
+
     def __init__(self) -> None:
         self._strategies: typing.Dict[
             str, warmwalrus.strategies.base.FileProcessingStrategy
@@ -34,7 +37,9 @@ class StrategyRegistry:
         self,
     ) -> typing.List[warmwalrus.strategies.base.FileProcessingStrategy]:
         """Get the default strategies that should be applied if none are specified."""
-        return [self.get_strategy("file_renamer"), self.get_strategy("claude_url")]
+        # Resolve on each call so the list is the caller's own and reflects any
+        # later re-registration under these names
+        return [self.get_strategy(name) for name in self.DEFAULT_STRATEGY_NAMES]
 
     def register_strategy(
         self, name: str, strategy: warmwalrus.strategies.base.FileProcessingStrategy
@@ -78,9 +83,8 @@ class StrategyRegistry:
         Returns:
             List of strategy instances (skips any not found)
         """
-        strategies = []
-        for name in names:
-            strategy = self.get_strategy(name)
-            if strategy:
-                strategies.append(strategy)
-        return strategies
+        return [
+            strategy
+            for strategy in (self._strategies.get(name) for name in names)
+            if strategy
+        ]